@@ -6,14 +6,19 @@ Compares: PTT (Python), RTN, Zantetsu Heuristic, Zantetsu Neural CRF
 Outputs detailed results to JSON for analysis.
 """
 
-import json
+import os
 import re
 import subprocess
 import sys
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from math import fsum
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+from ..common.jsonl import iter_jsonl, loads_json, write_json
 from ..common.paths import MODEL_DIR, REPO_ROOT, TARGET_RELEASE_DIR
 
 try:
@@ -52,9 +57,67 @@ CHAR_CNN_CHECKPOINT_CANDIDATES = [
     MODEL_DIR / "best_char_cnn_crf.pt",
     MODEL_DIR / "char_cnn_crf.pt",
 ]
+FIELDS = [
+    "title",
+    "group",
+    "season",
+    "episode",
+    "resolution",
+    "video_codec",
+    "audio_codec",
+    "source",
+    "year",
+    "crc32",
+    "extension",
+]
+CASE_CHUNKSIZE = 16
+CHAR_CNN_BATCH_SIZE = 64
+
+_TITLE_DELIM_RE = re.compile(r"[.\-_]")
+_WS_RE = re.compile(r"\s+")
+_DIGITS_RE = re.compile(r"\d+")
+_YEAR_DIGITS_RE = re.compile(r"\d{4}")
+_CRC32_RE = re.compile(r"[A-Fa-f0-9]{8}")
+_VERSION_RE = re.compile(r"v(\d+)", re.IGNORECASE)
+_RESOLUTION_RULES = (
+    (("2160", "4k"), "UHD2160"),
+    (("1080",), "FHD1080"),
+    (("720",), "HD720"),
+    (("480", "576"), "SD480"),
+)
+_CODEC_MAP = {
+    "hevc": "HEVC",
+    "h265": "HEVC",
+    "x265": "HEVC",
+    "avc": "H264",
+    "h264": "H264",
+    "x264": "H264",
+    "av1": "AV1",
+    "vp9": "VP9",
+}
+_AUDIO_RULES = (
+    ("flac", "FLAC"),
+    ("aac", "AAC"),
+    ("opus", "Opus"),
+    ("dts", "DTS"),
+    ("truehd", "TrueHD"),
+    ("ac3", "AC3"),
+    ("mp3", "MP3"),
+)
+_SOURCE_RULES = (
+    (("bluray", "blu-ray"), "BluRay"),
+    (("webdl", "web-dl"), "WebDL"),
+    (("webrip", "web-rip"), "WebRip"),
+    (("hdtv",), "HDTV"),
+    (("dvd",), "DVD"),
+)
+
+BenchmarkParser = tuple[str, Callable[[str], dict[str, Any]] | None, str]
 
 
 _char_cnn_parser = None
+_char_cnn_results: dict[str, dict[str, Any]] = {}
+_zantetsu_results: dict[str, dict[str, dict[str, Any]]] = {}
 
 
 def resolve_zantetsu_binary() -> Path | None:
@@ -85,7 +148,7 @@ def clean_entity_text(text: str, entity_type: str) -> str:
     if entity_type in {"TITLE", "GROUP"}:
         text = text.strip("[](){} -_.")
         text = text.replace("_", " ").replace(".", " ")
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _WS_RE.sub(" ", text).strip()
     elif entity_type == "EXTENSION":
         text = text.strip("[](){} ").lstrip(".").strip()
     else:
@@ -95,11 +158,11 @@ def clean_entity_text(text: str, entity_type: str) -> str:
 
 def parse_episode_value(text: str) -> dict[str, Any] | None:
     """Convert raw episode text into the benchmark's episode representation."""
-    numbers = [int(value) for value in re.findall(r"\d+", text)]
+    numbers = [int(value) for value in _DIGITS_RE.findall(text)]
     if not numbers:
         return None
 
-    version_match = re.search(r"v(\d+)", text, re.IGNORECASE)
+    version_match = _VERSION_RE.search(text)
     if version_match:
         return {
             "Version": {
@@ -166,14 +229,24 @@ class CharCnnBenchmarkParser:
         self.model.eval()
 
     def parse(self, filename: str) -> dict[str, Any]:
+        return self.parse_batch([filename])[0]
+
+    def parse_batch(self, filenames: list[str]) -> list[dict[str, Any]]:
+        """Decode `filenames` in one forward pass and convert each tag sequence."""
         with torch.inference_mode():
             input_tensor = torch.tensor(
-                [char_encode(filename)],
+                [char_encode(filename) for filename in filenames],
                 dtype=torch.long,
                 device=self.device,
             )
-            tag_ids = self.model.decode(input_tensor)[0]
+            batch_tag_ids = self.model.decode(input_tensor)
+
+        return [
+            self.build_result(filename, tag_ids)
+            for filename, tag_ids in zip(filenames, batch_tag_ids)
+        ]
 
+    def build_result(self, filename: str, tag_ids: list[int]) -> dict[str, Any]:
         entities = collect_char_cnn_entities(filename, tag_ids)
         title_chunks: list[str] = []
         group_chunks: list[str] = []
@@ -199,7 +272,7 @@ class CharCnnBenchmarkParser:
             elif entity_type == "GROUP":
                 group_chunks.append(entity_text)
             elif entity_type == "SEASON" and result["season"] is None:
-                match = re.search(r"\d+", entity_text)
+                match = _DIGITS_RE.search(entity_text)
                 if match:
                     result["season"] = int(match.group(0))
             elif entity_type == "EPISODE" and result["episode"] is None:
@@ -213,24 +286,24 @@ class CharCnnBenchmarkParser:
             elif entity_type == "SOURCE" and result["source"] is None:
                 result["source"] = convert_source(entity_text)
             elif entity_type == "YEAR" and result["year"] is None:
-                match = re.search(r"\d{4}", entity_text)
+                match = _YEAR_DIGITS_RE.search(entity_text)
                 if match:
                     result["year"] = int(match.group(0))
             elif entity_type == "CRC32" and result["crc32"] is None:
-                match = re.search(r"[A-Fa-f0-9]{8}", entity_text)
+                match = _CRC32_RE.search(entity_text)
                 if match:
                     result["crc32"] = match.group(0).upper()
             elif entity_type == "EXTENSION" and result["extension"] is None:
                 result["extension"] = entity_text.lower() or None
             elif entity_type == "VERSION" and result["version"] is None:
-                match = re.search(r"\d+", entity_text)
+                match = _DIGITS_RE.search(entity_text)
                 if match:
                     result["version"] = int(match.group(0))
 
         if title_chunks:
-            result["title"] = re.sub(r"\s+", " ", " ".join(title_chunks)).strip()
+            result["title"] = _WS_RE.sub(" ", " ".join(title_chunks)).strip()
         if group_chunks:
-            result["group"] = re.sub(r"\s+", " ", " ".join(group_chunks)).strip()
+            result["group"] = _WS_RE.sub(" ", " ".join(group_chunks)).strip()
 
         return result
 
@@ -250,17 +323,59 @@ def get_char_cnn_parser() -> CharCnnBenchmarkParser:
 
 def parse_with_char_cnn(filename: str) -> dict[str, Any]:
     """Parse using the trained char-CNN checkpoint."""
+    result = _char_cnn_results.get(filename)
+    if result is not None:
+        return result
     return get_char_cnn_parser().parse(filename)
 
 
+def batch_parse_with_char_cnn(filenames: list[str]) -> dict[str, dict[str, Any]]:
+    """Parse unique `filenames` in batches; failed batches are left to `parse_with_char_cnn`."""
+    results: dict[str, dict[str, Any]] = {}
+    try:
+        parser = get_char_cnn_parser()
+    except Exception:
+        # Workers retry per filename and record the error on each case.
+        return results
+
+    unique = list(dict.fromkeys(filenames))
+    for start in range(0, len(unique), CHAR_CNN_BATCH_SIZE):
+        batch = unique[start : start + CHAR_CNN_BATCH_SIZE]
+        try:
+            results.update(zip(batch, parser.parse_batch(batch)))
+        except Exception:
+            continue
+    return results
+
+
+def set_parser_results(
+    char_cnn_results: dict[str, dict[str, Any]],
+    zantetsu_results: dict[str, dict[str, dict[str, Any]]],
+) -> None:
+    """Pool initializer: share results parsed up front in the parent."""
+    global _char_cnn_results, _zantetsu_results
+    _char_cnn_results = char_cnn_results
+    _zantetsu_results = zantetsu_results
+
+
+@lru_cache(maxsize=None)
+def _ptt_raw(filename: str) -> dict[str, Any]:
+    return ptt_parse(filename)
+
+
+@lru_cache(maxsize=None)
+def _rtn_raw(filename: str) -> Any:
+    return rtn_parse(filename)
+
+
 def parse_with_ptt(filename: str) -> dict[str, Any]:
     """Parse using PTT (Python Torrent Title parser)."""
-    result = ptt_parse(filename)
+    result = _ptt_raw(filename)
 
     def convert_episode(e: list[int]) -> dict:
         if len(e) == 1:
             return {"Single": e[0]}
-        return {"Multi": e}
+        return {"Multi": list(e)}
 
     def convert_season(s: list[int]) -> int | None:
         return s[0] if s else None
@@ -285,7 +400,7 @@ def parse_with_ptt(filename: str) -> dict[str, Any]:
 
 def parse_with_rtn(filename: str) -> dict[str, Any]:
     """Parse using RTN (Rank Torrent Name)."""
-    result = rtn_parse(filename)
+    result = _rtn_raw(filename)
 
     # RTN returns ParsedData directly, not wrapped
     data = result
@@ -293,7 +408,7 @@ def parse_with_rtn(filename: str) -> dict[str, Any]:
     def convert_episode(e: list[int]) -> dict:
         if len(e) == 1:
             return {"Single": e[0]}
-        return {"Multi": e}
+        return {"Multi": list(e)}
 
     def convert_season(s: list[int]) -> int | None:
         return s[0] if s else None
@@ -320,15 +435,10 @@ def convert_resolution(res: str | None) -> str | None:
     """Convert resolution to Zantetsu format."""
     if not res:
         return None
-    res = res.lower().replace("p", "p").replace("i", "i")
-    if "2160" in res or "4k" in res:
-        return "UHD2160"
-    elif "1080" in res:
-        return "FHD1080"
-    elif "720" in res:
-        return "HD720"
-    elif "480" in res or "576" in res:
-        return "SD480"
+    res = res.lower()
+    for needles, resolution in _RESOLUTION_RULES:
+        if any(needle in res for needle in needles):
+            return resolution
     return None
 
 
@@ -336,39 +446,19 @@ def convert_codec(codec: str | None) -> str | None:
     """Convert codec to Zantetsu format."""
     if not codec:
         return None
-    codec = codec.lower()
-    if codec in ("hevc", "h265", "x265"):
-        return "HEVC"
-    elif codec in ("avc", "h264", "x264"):
-        return "H264"
-    elif codec in ("av1",):
-        return "AV1"
-    elif codec in ("vp9",):
-        return "VP9"
-    return None
+    return _CODEC_MAP.get(codec.lower())
 
 
 def convert_audio(audio: list[str] | None) -> str | None:
     """Convert audio to Zantetsu format."""
     if not audio:
         return None
-    audio_str = audio[0].lower() if audio else None
+    audio_str = audio[0].lower()
     if not audio_str:
         return None
-    if "flac" in audio_str:
-        return "FLAC"
-    elif "aac" in audio_str:
-        return "AAC"
-    elif "opus" in audio_str:
-        return "Opus"
-    elif "dts" in audio_str:
-        return "DTS"
-    elif "truehd" in audio_str:
-        return "TrueHD"
-    elif "ac3" in audio_str:
-        return "AC3"
-    elif "mp3" in audio_str:
-        return "MP3"
+    for needle, audio_codec in _AUDIO_RULES:
+        if needle in audio_str:
+            return audio_codec
     return None
 
 
@@ -377,23 +467,89 @@ def convert_source(quality: str | None) -> str | None:
     if not quality:
         return None
     quality = quality.lower()
-    if "bluray" in quality or "blu-ray" in quality:
-        return "BluRay"
-    elif "webdl" in quality or "web-dl" in quality:
-        return "WebDL"
-    elif "webrip" in quality or "web-rip" in quality:
-        return "WebRip"
-    elif "hdtv" in quality:
-        return "HDTV"
-    elif "dvd" in quality:
-        return "DVD"
+    for needles, source in _SOURCE_RULES:
+        if any(needle in quality for needle in needles):
+            return source
     return None
 
 
+def zantetsu_result(data: dict[str, Any]) -> dict[str, Any]:
+    """Pick the benchmark fields out of one `zantetsu-parse` JSON line."""
+    return {
+        "title": data.get("title"),
+        "group": data.get("group"),
+        "season": data.get("season"),
+        "episode": data.get("episode"),
+        "resolution": data.get("resolution"),
+        "video_codec": data.get("video_codec"),
+        "audio_codec": data.get("audio_codec"),
+        "source": data.get("source"),
+        "year": data.get("year"),
+        "crc32": data.get("crc32"),
+        "extension": data.get("extension"),
+        "version": data.get("version"),
+    }
+
+
+def batch_parse_with_zantetsu(
+    filenames: list[str], zantetsu_binary: Path, mode: str
+) -> dict[str, dict[str, Any]]:
+    """Parse unique `filenames` through one Zantetsu process for `mode`.
+
+    The binary answers each stdin line with one JSON line, so a single process
+    (and, for neural, a single model load) covers the whole run. Filenames it
+    did not answer, or whose answers could not be matched up, are left to
+    `parse_with_zantetsu`.
+    """
+    # The binary skips blank lines, which would shift every later answer.
+    unique = [
+        filename
+        for filename in dict.fromkeys(filenames)
+        if filename.strip() and "\n" not in filename and "\r" not in filename
+    ]
+    if not unique:
+        return {}
+
+    try:
+        process = subprocess.Popen(
+            [str(zantetsu_binary), mode],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+    except OSError as exc:
+        print(f"WARNING: zantetsu {mode} failed to start: {exc}")
+        return {}
+
+    stdout, stderr = process.communicate("".join(f"{name}\n" for name in unique))
+    if process.returncode != 0:
+        details = stderr.strip() or f"exit code {process.returncode}"
+        print(f"WARNING: zantetsu {mode} exited early: {details}")
+
+    # Split on "\n" only: serde_json leaves U+2028/U+2029/U+0085 unescaped, and
+    # str.splitlines() would break a response on them. Stop at the first answer that
+    # does not parse or echo its filename, so nothing after it is misattributed.
+    results: dict[str, dict[str, Any]] = {}
+    for filename, line in zip(unique, stdout.split("\n")):
+        try:
+            data = loads_json(line)
+        except ValueError:
+            break
+        if not isinstance(data, dict) or data.get("input") != filename.strip():
+            break
+        results[filename] = zantetsu_result(data)
+    return results
+
+
 def parse_with_zantetsu(
     filename: str, zantetsu_binary: Path, mode: str = "heuristic"
 ) -> dict[str, Any]:
     """Parse using Zantetsu binary."""
+    result = _zantetsu_results.get(mode, {}).get(filename)
+    if result is not None:
+        return result
+
     result = subprocess.run(
         [str(zantetsu_binary), mode],
         input=filename,
@@ -406,35 +562,40 @@ def parse_with_zantetsu(
         details = stderr or stdout or "unknown zantetsu process error"
         raise RuntimeError(f"zantetsu {mode} failed: {details}")
 
-    data = json.loads(result.stdout.strip())
-    return {
-        "title": data.get("title"),
-        "group": data.get("group"),
-        "season": data.get("season"),
-        "episode": data.get("episode"),
-        "resolution": data.get("resolution"),
-        "video_codec": data.get("video_codec"),
-        "audio_codec": data.get("audio_codec"),
-        "source": data.get("source"),
-        "year": data.get("year"),
-        "crc32": data.get("crc32"),
-        "extension": data.get("extension"),
-        "version": data.get("version"),
-    }
+    return zantetsu_result(loads_json(result.stdout.strip()))
 
 
 def normalize_title(title: str | None) -> str:
     """Normalize title for comparison."""
     if not title:
         return ""
-    title = title.lower()
-    title = re.sub(r"[.\-_]", " ", title)
-    title = re.sub(r"\s+", " ", title)
-    return title.strip()
+    title = _TITLE_DELIM_RE.sub(" ", title.lower())
+    return _WS_RE.sub(" ", title).strip()
+
+
+def normalize_field(value: Any, field: str) -> str:
+    """Normalize a field value the way `field_score` compares it."""
+    if field == "title":
+        return normalize_title(value)
+    return str(value).lower()
+
+
+def normalize_expected(expected: dict[str, Any]) -> list[str | None]:
+    """Normalize a case's expected values once, in `FIELDS` order."""
+    return [
+        None if expected.get(field) is None else normalize_field(expected[field], field)
+        for field in FIELDS
+    ]
+
 
+def field_score(
+    expected: Any, actual: Any, field: str, expected_norm: str | None = None
+) -> tuple[float, str]:
+    """Calculate score for a single field. Returns (score, reason).
 
-def field_score(expected: Any, actual: Any, field: str) -> tuple[float, str]:
-    """Calculate score for a single field. Returns (score, reason)."""
+    `expected_norm` is `normalize_field(expected, field)` when the caller has
+    already computed it.
+    """
     if expected is None and actual is None:
         return 1.0, "both_none"
     if expected is None and actual is not None:
@@ -442,10 +603,12 @@ def field_score(expected: Any, actual: Any, field: str) -> tuple[float, str]:
     if expected is not None and actual is None:
         return 0.0, "expected_got_none"
 
+    if expected_norm is None:
+        expected_norm = normalize_field(expected, field)
+    actual_norm = normalize_field(actual, field)
+
     # Special handling for title (fuzzy match)
     if field == "title":
-        expected_norm = normalize_title(expected)
-        actual_norm = normalize_title(actual)
         if expected_norm == actual_norm:
             return 1.0, "exact_match"
         if expected_norm in actual_norm or actual_norm in expected_norm:
@@ -453,37 +616,76 @@ def field_score(expected: Any, actual: Any, field: str) -> tuple[float, str]:
         return 0.0, f"no_match: expected='{expected_norm}' got='{actual_norm}'"
 
     # Exact match for other fields
-    if str(expected).lower() == str(actual).lower():
+    if expected_norm == actual_norm:
         return 1.0, "exact_match"
     return 0.0, f"no_match: expected={expected} got={actual}"
 
 
 def calculate_total_score(
-    expected: dict[str, Any], actual: dict[str, Any]
-) -> tuple[float, dict[str, tuple[float, str]]]:
-    """Calculate total score and field-by-field results."""
-    fields = [
-        "title",
-        "group",
-        "season",
-        "episode",
-        "resolution",
-        "video_codec",
-        "audio_codec",
-        "source",
-        "year",
-        "crc32",
-        "extension",
+    expected: dict[str, Any],
+    actual: dict[str, Any],
+    expected_norm: list[str | None] | None = None,
+) -> tuple[float, list[tuple[float, str]]]:
+    """Calculate total score and per-field results, in `FIELDS` order."""
+    if expected_norm is None:
+        expected_norm = normalize_expected(expected)
+    field_results = [
+        field_score(expected.get(field), actual.get(field), field, norm)
+        for field, norm in zip(FIELDS, expected_norm)
+    ]
+    total = sum(score for score, _ in field_results)
+    return total / len(FIELDS), field_results
+
+
+def build_benchmark_parsers(
+    zantetsu_binary: Path | None, char_cnn_available: bool
+) -> list[BenchmarkParser]:
+    """List `(name, parse_fn, skip_reason)` entries in report order."""
+
+    def zantetsu(mode: str) -> Callable[[str], dict[str, Any]] | None:
+        if zantetsu_binary is None:
+            return None
+        return partial(parse_with_zantetsu, zantetsu_binary=zantetsu_binary, mode=mode)
+
+    return [
+        ("ptt", parse_with_ptt, ""),
+        ("rtn", parse_with_rtn, ""),
+        ("zantetsu_heuristic", zantetsu("heuristic"), "binary not available"),
+        ("zantetsu_neural", zantetsu("neural"), "binary not available"),
+        (
+            "zantetsu_char_cnn",
+            parse_with_char_cnn if char_cnn_available else None,
+            "char-CNN checkpoint not available",
+        ),
+        ("zantetsu_auto", zantetsu("auto"), "binary not available"),
     ]
 
-    total = 0.0
-    field_results = {}
-    for field in fields:
-        score, reason = field_score(expected.get(field), actual.get(field), field)
-        field_results[field] = (score, reason)
-        total += score
 
-    return total / len(fields), field_results
+def run_case(case: dict[str, Any], parsers: list[BenchmarkParser]) -> dict[str, Any]:
+    """Run every available parser on one test case."""
+    filename = case["input"]
+    expected = case["expected"]
+    expected_norm = normalize_expected(expected)
+    case_result = {"input": filename, "expected": expected, "parsers": {}}
+
+    for name, parse, skip_reason in parsers:
+        if parse is None:
+            case_result["parsers"][name] = {"skipped": skip_reason}
+            continue
+        try:
+            actual = parse(filename)
+            score, field_results = calculate_total_score(
+                expected, actual, expected_norm
+            )
+            case_result["parsers"][name] = {
+                "result": actual,
+                "score": score,
+                "fields": field_results,
+            }
+        except Exception as e:
+            case_result["parsers"][name] = {"error": str(e)}
+
+    return case_result
 
 
 def main():
@@ -522,11 +724,7 @@ def main():
         sys.exit(1)
 
     # Load test cases
-    test_cases = []
-    with open(REGRESSION_DATA) as f:
-        for line in f:
-            data = json.loads(line)
-            test_cases.append(data)
+    test_cases = list(iter_jsonl(REGRESSION_DATA))
 
     print(f"Loaded {len(test_cases)} test cases")
     print("=" * 60)
@@ -541,165 +739,60 @@ def main():
         "zantetsu_char_cnn": {"scores": [], "errors": 0, "field_wins": {}},
     }
 
-    fields = [
-        "title",
-        "group",
-        "season",
-        "episode",
-        "resolution",
-        "video_codec",
-        "audio_codec",
-        "source",
-        "year",
-        "crc32",
-        "extension",
-    ]
     for parser in results:
-        results[parser]["field_wins"] = {f: 0 for f in fields}
+        results[parser]["field_wins"] = {f: 0 for f in FIELDS}
 
     # Detailed results for JSON output
     detailed_results = []
 
-    # Run benchmarks
-    for i, case in enumerate(test_cases):
-        filename = case["input"]
-        expected = case["expected"]
-
-        case_result = {"input": filename, "expected": expected, "parsers": {}}
-
-        # PTT
-        try:
-            actual_ptt = parse_with_ptt(filename)
-            score_ptt, field_results_ptt = calculate_total_score(expected, actual_ptt)
-            results["ptt"]["scores"].append(score_ptt)
-            case_result["parsers"]["ptt"] = {
-                "result": actual_ptt,
-                "score": score_ptt,
-                "fields": field_results_ptt,
-            }
-            for f in fields:
-                if field_results_ptt[f][0] == 1.0:
-                    results["ptt"]["field_wins"][f] += 1
-        except Exception as e:
-            results["ptt"]["errors"] += 1
-            case_result["parsers"]["ptt"] = {"error": str(e)}
-
-        # RTN
-        try:
-            actual_rtn = parse_with_rtn(filename)
-            score_rtn, field_results_rtn = calculate_total_score(expected, actual_rtn)
-            results["rtn"]["scores"].append(score_rtn)
-            case_result["parsers"]["rtn"] = {
-                "result": actual_rtn,
-                "score": score_rtn,
-                "fields": field_results_rtn,
-            }
-            for f in fields:
-                if field_results_rtn[f][0] == 1.0:
-                    results["rtn"]["field_wins"][f] += 1
-        except Exception as e:
-            results["rtn"]["errors"] += 1
-            case_result["parsers"]["rtn"] = {"error": str(e)}
-
-        # Zantetsu Heuristic (if available)
-        if zantetsu_available:
-            try:
-                actual_zh = parse_with_zantetsu(filename, zantetsu_binary, "heuristic")
-                score_zh, field_results_zh = calculate_total_score(expected, actual_zh)
-                results["zantetsu_heuristic"]["scores"].append(score_zh)
-                case_result["parsers"]["zantetsu_heuristic"] = {
-                    "result": actual_zh,
-                    "score": score_zh,
-                    "fields": field_results_zh,
-                }
-                for f in fields:
-                    if field_results_zh[f][0] == 1.0:
-                        results["zantetsu_heuristic"]["field_wins"][f] += 1
-            except Exception as e:
-                results["zantetsu_heuristic"]["errors"] += 1
-                case_result["parsers"]["zantetsu_heuristic"] = {"error": str(e)}
-        else:
-            case_result["parsers"]["zantetsu_heuristic"] = {
-                "skipped": "binary not available"
-            }
-
-        # Zantetsu Neural (if available)
-        if zantetsu_available:
-            try:
-                actual_zn = parse_with_zantetsu(filename, zantetsu_binary, "neural")
-                score_zn, field_results_zn = calculate_total_score(expected, actual_zn)
-                results["zantetsu_neural"]["scores"].append(score_zn)
-                case_result["parsers"]["zantetsu_neural"] = {
-                    "result": actual_zn,
-                    "score": score_zn,
-                    "fields": field_results_zn,
-                }
-                for f in fields:
-                    if field_results_zn[f][0] == 1.0:
-                        results["zantetsu_neural"]["field_wins"][f] += 1
-            except Exception as e:
-                results["zantetsu_neural"]["errors"] += 1
-                case_result["parsers"]["zantetsu_neural"] = {"error": str(e)}
-        else:
-            case_result["parsers"]["zantetsu_neural"] = {
-                "skipped": "binary not available"
-            }
-
-        # Zantetsu Character CNN (if available)
-        if char_cnn_available:
-            try:
-                actual_zc = parse_with_char_cnn(filename)
-                score_zc, field_results_zc = calculate_total_score(expected, actual_zc)
-                results["zantetsu_char_cnn"]["scores"].append(score_zc)
-                case_result["parsers"]["zantetsu_char_cnn"] = {
-                    "result": actual_zc,
-                    "score": score_zc,
-                    "fields": field_results_zc,
-                }
-                for f in fields:
-                    if field_results_zc[f][0] == 1.0:
-                        results["zantetsu_char_cnn"]["field_wins"][f] += 1
-            except Exception as e:
-                results["zantetsu_char_cnn"]["errors"] += 1
-                case_result["parsers"]["zantetsu_char_cnn"] = {"error": str(e)}
-        else:
-            case_result["parsers"]["zantetsu_char_cnn"] = {
-                "skipped": "char-CNN checkpoint not available"
-            }
-
-        # Zantetsu Auto (if available)
-        if zantetsu_available:
-            try:
-                actual_za = parse_with_zantetsu(filename, zantetsu_binary, "auto")
-                score_za, field_results_za = calculate_total_score(expected, actual_za)
-                results["zantetsu_auto"]["scores"].append(score_za)
-                case_result["parsers"]["zantetsu_auto"] = {
-                    "result": actual_za,
-                    "score": score_za,
-                    "fields": field_results_za,
-                }
-                for f in fields:
-                    if field_results_za[f][0] == 1.0:
-                        results["zantetsu_auto"]["field_wins"][f] += 1
-            except Exception as e:
-                results["zantetsu_auto"]["errors"] += 1
-                case_result["parsers"]["zantetsu_auto"] = {"error": str(e)}
-        else:
-            case_result["parsers"]["zantetsu_auto"] = {
-                "skipped": "binary not available"
-            }
-
-        detailed_results.append(case_result)
-
-        if (i + 1) % 20 == 0:
-            print(f"Processed {i + 1}/{len(test_cases)}...")
+    # Run benchmarks; cases are independent, so spread them across processes
+    parsers = build_benchmark_parsers(zantetsu_binary, char_cnn_available)
+    # Decode char-CNN inputs in batches once here rather than loading the model
+    # and running a batch of one per filename in every worker.
+    filenames = [case["input"] for case in test_cases]
+    char_cnn_results = (
+        batch_parse_with_char_cnn(filenames) if char_cnn_available else {}
+    )
+    # Likewise run each Zantetsu mode as one streaming process here, instead of
+    # one process (and neural model load) per mode in every worker.
+    zantetsu_results = {
+        mode: batch_parse_with_zantetsu(filenames, zantetsu_binary, mode)
+        for mode in ("heuristic", "neural", "auto")
+        if zantetsu_binary is not None
+    }
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=set_parser_results,
+        initargs=(char_cnn_results, zantetsu_results),
+    ) as executor:
+        case_results = executor.map(
+            partial(run_case, parsers=parsers),
+            test_cases,
+            chunksize=CASE_CHUNKSIZE,
+        )
+        for i, case_result in enumerate(case_results):
+            for name, parser_result in case_result["parsers"].items():
+                if "error" in parser_result:
+                    results[name]["errors"] += 1
+                elif "score" in parser_result:
+                    results[name]["scores"].append(parser_result["score"])
+                    field_wins = results[name]["field_wins"]
+                    for f, (score, _) in zip(FIELDS, parser_result["fields"]):
+                        if score == 1.0:
+                            field_wins[f] += 1
+                    parser_result["fields"] = dict(zip(FIELDS, parser_result["fields"]))
+
+            detailed_results.append(case_result)
+
+            if (i + 1) % 20 == 0:
+                print(f"Processed {i + 1}/{len(test_cases)}...")
 
     # Save detailed results to JSON
     output_data = {
         "metadata": {
             "timestamp": datetime.now().isoformat(),
             "test_count": len(test_cases),
-            "fields_evaluated": fields,
+            "fields_evaluated": FIELDS,
         },
         "summary": {},
         "field_analysis": {},
@@ -717,16 +810,16 @@ def main():
         field_wins = data["field_wins"]
 
         if scores:
-            avg = sum(scores) / len(scores)
-            min_s = min(scores)
-            max_s = max(scores)
-
             sorted_scores = sorted(scores)
-            p50 = sorted_scores[len(sorted_scores) // 2]
-            p90 = sorted_scores[int(len(sorted_scores) * 0.9)]
-            p95 = sorted_scores[int(len(sorted_scores) * 0.95)]
+            count = len(sorted_scores)
+            avg = fsum(sorted_scores) / count
+            min_s = sorted_scores[0]
+            max_s = sorted_scores[-1]
+            p50 = sorted_scores[count // 2]
+            p90 = sorted_scores[int(count * 0.9)]
+            p95 = sorted_scores[int(count * 0.95)]
 
-            perfect = sum(1 for s in scores if s >= 0.99)
+            perfect = count - bisect_left(sorted_scores, 0.99)
 
             print(f"\n{name.upper().replace('_', ' ')}:")
             print(f"  Samples:    {len(scores)}")
@@ -761,7 +854,7 @@ def main():
     print("FIELD-BY-FIELD ANALYSIS")
     print("=" * 60)
 
-    for field in fields:
+    for field in FIELDS:
         print(f"\n{field}:")
         for name, data in results.items():
             wins = data["field_wins"][field]
@@ -773,9 +866,7 @@ def main():
             output_data["field_analysis"][field][name] = {"wins": wins, "pct": pct}
 
     # Save to JSON
-    OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT_FILE, "w") as f:
-        json.dump(output_data, f, indent=2)
+    write_json(OUTPUT_FILE, output_data)
     print(f"\n\nDetailed results saved to: {OUTPUT_FILE}")
 
     # Winner determination
@@ -784,10 +875,8 @@ def main():
     print("=" * 60)
 
     best = max(
-        results.items(),
-        key=lambda x: (
-            sum(x[1]["scores"]) / len(x[1]["scores"]) if x[1]["scores"] else 0
-        ),
+        output_data["summary"].items(),
+        key=lambda x: x[1].get("average", 0),
     )
     print(f"Best parser: {best[0].replace('_', ' ').title()}")
 
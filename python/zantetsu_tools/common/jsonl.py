@@ -4,14 +4,35 @@ import json
 from pathlib import Path
 from typing import Any, Iterable, Iterator
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads_json(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(path: Path, data: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2)
+
 
 def iter_jsonl(path: Path) -> Iterator[dict[str, Any]]:
-    with path.open("r", encoding="utf-8") as handle:
+    # Binary lines go straight to orjson; the stdlib fallback accepts bytes too.
+    with path.open("rb") as handle:
         for line in handle:
             line = line.strip()
             if not line:
                 continue
-            yield json.loads(line)
+            yield loads_json(line)
 
 
 def write_jsonl(path: Path, records: Iterable[dict[str, Any]]) -> int:
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
 import json
+import os
+import shutil
+import struct
 from pathlib import Path
 from typing import Any
 
 from safetensors import safe_open
-from safetensors.torch import save_file
 
 from .paths import MODEL_DIR
 
 
 DEFAULT_MODEL_PATH = MODEL_DIR / "ner_model" / "model.safetensors"
 DEFAULT_CONFIG_PATH = MODEL_DIR / "ner_model" / "config.json"
+HEADER_ALIGNMENT = 8
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
 TRAIN_TAGS = [
     "O",
     "B-TITLE",
@@ -38,16 +42,52 @@ def iter_keys(model_path: Path = DEFAULT_MODEL_PATH) -> list[str]:
         return list(tensor_file.keys())
 
 
+def _copy_range(src, dst, offset: int, count: int) -> None:
+    """Copy `count` bytes starting at `offset` from `src` to `dst`."""
+    dst.flush()
+    if hasattr(os, "sendfile"):
+        try:
+            while count > 0:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, count)
+                if sent == 0:
+                    break
+                offset += sent
+                count -= sent
+            return
+        except OSError:
+            # Some filesystems refuse sendfile between regular files; fall through.
+            pass
+
+    src.seek(offset)
+    shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
+
 def convert_layer_norm_keys(model_path: Path = DEFAULT_MODEL_PATH) -> Path:
+    """Rename LayerNorm `gamma`/`beta` tensors to `weight`/`bias` in place.
+
+    Only the JSON header is rewritten. Tensor offsets are relative to the start
+    of the data section, so the body is copied byte-for-byte without loading it.
+    """
     temp_path = model_path.with_suffix(".converted.safetensors")
-    tensors: dict[str, Any] = {}
 
-    with safe_open(model_path, framework="pt") as tensor_file:
-        for key in tensor_file.keys():
-            converted_key = key.replace(".gamma", ".weight").replace(".beta", ".bias")
-            tensors[converted_key] = tensor_file.get_tensor(key)
+    with model_path.open("rb") as src:
+        (header_len,) = struct.unpack("<Q", src.read(8))
+        header = json.loads(src.read(header_len))
+        body_offset = 8 + header_len
+        body_len = os.fstat(src.fileno()).st_size - body_offset
+
+        converted = {
+            key.replace(".gamma", ".weight").replace(".beta", ".bias"): value
+            for key, value in header.items()
+        }
+        encoded = json.dumps(converted, separators=(",", ":")).encode("utf-8")
+        encoded += b" " * (-len(encoded) % HEADER_ALIGNMENT)
+
+        with temp_path.open("wb") as dst:
+            dst.write(struct.pack("<Q", len(encoded)))
+            dst.write(encoded)
+            _copy_range(src, dst, body_offset, body_len)
 
-    save_file(tensors, str(temp_path))
     temp_path.replace(model_path)
     return model_path
 
@@ -56,10 +96,11 @@ def inspect_ner_model(
     model_path: Path = DEFAULT_MODEL_PATH,
     config_path: Path = DEFAULT_CONFIG_PATH,
 ) -> dict[str, Any]:
+    # Shapes come from the header via `get_slice`, so no tensor bytes are read.
     with safe_open(model_path, framework="pt") as tensor_file:
-        classifier_weight = tensor_file.get_tensor("classifier.weight")
-        classifier_bias = tensor_file.get_tensor("classifier.bias")
         keys = list(tensor_file.keys())
+        classifier_weight_shape = tensor_file.get_slice("classifier.weight").get_shape()
+        classifier_bias_shape = tensor_file.get_slice("classifier.bias").get_shape()
 
     with config_path.open("r", encoding="utf-8") as handle:
         config = json.load(handle)
@@ -77,9 +118,9 @@ def inspect_ner_model(
             )
 
     return {
-        "classifier_weight_shape": list(classifier_weight.shape),
-        "classifier_bias_shape": list(classifier_bias.shape),
-        "num_labels": classifier_weight.shape[0],
+        "classifier_weight_shape": list(classifier_weight_shape),
+        "classifier_bias_shape": list(classifier_bias_shape),
+        "num_labels": classifier_weight_shape[0],
         "id2label": config["id2label"],
         "train_tags": TRAIN_TAGS,
         "mismatches": mismatches,
@@ -22,3 +22,14 @@ def configure_torch_runtime(device: torch.device) -> None:
 
     if hasattr(torch, "set_float32_matmul_precision"):
         torch.set_float32_matmul_precision("high")
+
+
+def resolve_amp_dtype(device: torch.device, precision: str) -> torch.dtype | None:
+    """Autocast dtype for `precision` ("auto", "bf16", "fp16" or "fp32"), or None to stay in fp32."""
+    if device.type != "cuda" or precision == "fp32":
+        return None
+    if precision == "bf16":
+        return torch.bfloat16
+    if precision == "fp16":
+        return torch.float16
+    return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
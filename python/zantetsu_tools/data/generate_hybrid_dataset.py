@@ -4,10 +4,17 @@
 from __future__ import annotations
 
 import argparse
+from bisect import bisect_right
+from contextlib import ExitStack
+from functools import partial
+from itertools import islice
 import json
+from multiprocessing.pool import Pool
+import os
+from operator import attrgetter
 from pathlib import Path
 import re
-from typing import Any
+from typing import Any, Callable, Iterator
 
 from ..common.jsonl import iter_jsonl
 from .hybrid_tokenizer import (
@@ -25,20 +32,28 @@ from .hybrid_tokenizer import (
 )
 
 
-YEAR_RE = re.compile(r"^(?:19|20)\d{2}$")
-EPISODE_RANGE_RE = re.compile(r"^\d{1,4}-\d{1,4}$")
 SEASON_RE = re.compile(r"(?i)^s\d{1,2}$")
 EPISODE_RE = re.compile(r"(?i)^(?:e|ep)\d{1,4}$")
 VERSION_RE = re.compile(r"(?i)^v\d+$")
 CRC32_RE = re.compile(r"^[0-9a-f]{8}$", re.IGNORECASE)
+EXAMPLE_CHUNKSIZE = 256
+# Chunks per worker read and queued ahead of the writer.
+EXAMPLE_BATCH_CHUNKS = 4
+
+
 def token_indices_for_span(
     tokens: list[HybridToken], start: int, end: int
 ) -> list[int]:
-    return [
-        token.index
-        for token in tokens
-        if token.end > start and token.start < end and token.text.strip()
-    ]
+    # Tokens are in positional order: skip straight to the first one ending
+    # after `start` and stop at the first one past the span.
+    indices: list[int] = []
+    first = bisect_right(tokens, start, key=attrgetter("end"))
+    for token in islice(tokens, first, None):
+        if token.start >= end:
+            break
+        if token.text.strip():
+            indices.append(token.index)
+    return indices
 
 
 def mark_indices(
@@ -59,20 +74,25 @@ def mark_indices(
     return True
 
 
-def find_casefold_spans(text: str, candidate: str) -> list[tuple[int, int]]:
+def find_casefold_spans(
+    text: str, candidate: str, haystack: str | None = None
+) -> list[tuple[int, int]]:
     if not candidate:
         return []
 
-    spans: list[tuple[int, int]] = []
-    haystack = text.casefold()
+    if haystack is None:
+        haystack = text.casefold()
     needle = candidate.casefold()
-    cursor = 0
-    while True:
-        position = haystack.find(needle, cursor)
-        if position == -1:
-            break
-        spans.append((position, position + len(candidate)))
-        cursor = position + 1
+    position = haystack.find(needle)
+    if position == -1:
+        return []
+
+    # Overlapping matches are kept, so each search resumes one past the last hit.
+    spans: list[tuple[int, int]] = []
+    length = len(candidate)
+    while position != -1:
+        spans.append((position, position + length))
+        position = haystack.find(needle, position + 1)
     return spans
 
 
@@ -82,11 +102,14 @@ def best_span_match(
     candidates: list[str],
     *,
     prefer_bracketed: bool = False,
+    haystack: str | None = None,
 ) -> list[int]:
     scored_matches: list[tuple[int, int, list[int]]] = []
+    if haystack is None:
+        haystack = text.casefold()
 
     for candidate in candidates:
-        for start, end in find_casefold_spans(text, candidate):
+        for start, end in find_casefold_spans(text, candidate, haystack):
             indices = token_indices_for_span(tokens, start, end)
             if not indices:
                 continue
@@ -102,19 +125,40 @@ def best_span_match(
 
 
 def title_variants(title: str) -> list[str]:
-    variants = {title}
-    variants.add(title.replace(" ", "."))
-    variants.add(title.replace(" ", "_"))
-    variants.add(title.replace(" - ", "-"))
-    variants.add(title.replace(":", " -"))
+    variants = dict.fromkeys(
+        (
+            title,
+            title.replace(" ", "."),
+            title.replace(" ", "_"),
+            title.replace(" - ", "-"),
+            title.replace(":", " -"),
+        )
+    )
     return [variant for variant in variants if variant]
 
 
 def group_variants(group: str) -> list[str]:
-    variants = {group, f"[{group}]", f"({group})", f"{{{group}}}"}
+    variants = dict.fromkeys((group, f"[{group}]", f"({group})", f"{{{group}}}"))
     return [variant for variant in variants if variant]
 
 
+def is_year(text: str) -> bool:
+    # Same as fullmatching (?:19|20)\d{2}; isdecimal() is exactly what \d matches.
+    return len(text) == 4 and text[:2] in ("19", "20") and text[2:].isdecimal()
+
+
+def is_episode_range(text: str) -> bool:
+    # Same as fullmatching \d{1,4}-\d{1,4}.
+    start, dash, end = text.partition("-")
+    return (
+        bool(dash)
+        and 0 < len(start) <= 4
+        and 0 < len(end) <= 4
+        and start.isdecimal()
+        and end.isdecimal()
+    )
+
+
 def episode_context(tokens: list[HybridToken], index: int) -> bool:
     previous = tokens[index - 1].normalized if index > 0 else ""
     next_token = tokens[index + 1].normalized if index + 1 < len(tokens) else ""
@@ -128,18 +172,29 @@ def episode_context(tokens: list[HybridToken], index: int) -> bool:
 
 def build_tags(text: str, tokens: list[HybridToken], metadata: dict[str, Any]) -> list[str]:
     tags = ["O"] * len(tokens)
+    haystack = text.casefold()
 
     group = str(metadata.get("group") or "").strip()
     if group:
         mark_indices(
             tags,
-            best_span_match(text, tokens, group_variants(group), prefer_bracketed=True),
+            best_span_match(
+                text,
+                tokens,
+                group_variants(group),
+                prefer_bracketed=True,
+                haystack=haystack,
+            ),
             "GROUP",
         )
 
     title = str(metadata.get("title") or "").strip()
     if title:
-        mark_indices(tags, best_span_match(text, tokens, title_variants(title)), "TITLE")
+        mark_indices(
+            tags,
+            best_span_match(text, tokens, title_variants(title), haystack=haystack),
+            "TITLE",
+        )
 
     episode = str(metadata.get("episode") or "").strip()
 
@@ -149,11 +204,11 @@ def build_tags(text: str, tokens: list[HybridToken], metadata: dict[str, Any]) -
         if normalized in {"[", "]", "(", ")", "{", "}", ".", "-", "_", "+"}:
             continue
 
-        if EPISODE_RANGE_RE.fullmatch(normalized):
+        if is_episode_range(normalized):
             mark_indices(tags, [index], "EP_RANGE")
             continue
 
-        if YEAR_RE.fullmatch(normalized):
+        if is_year(normalized):
             mark_indices(tags, [index], "YEAR")
             continue
 
@@ -251,6 +306,21 @@ def build_example(record: dict[str, Any], include_features: bool) -> dict[str, A
     return result
 
 
+def pool_examples(
+    pool: Pool,
+    build: Callable[[dict[str, Any]], dict[str, Any] | None],
+    records: Iterator[dict[str, Any]],
+    batch_size: int,
+) -> Iterator[dict[str, Any] | None]:
+    """Build examples in input order, handing `pool` one bounded batch at a time.
+
+    `Pool.imap` drains `records` eagerly, so the whole input would be parsed and
+    queued; here nothing past the current batch is read until it is consumed.
+    """
+    while batch := list(islice(records, batch_size)):
+        yield from pool.map(build, batch, chunksize=EXAMPLE_CHUNKSIZE)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Generate a structurally tokenized hybrid BIO dataset"
@@ -276,17 +346,33 @@ def main() -> None:
         action="store_true",
         help="Persist derived token feature dictionaries into the output JSONL",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes used to build examples (1 disables multiprocessing)",
+    )
     args = parser.parse_args()
 
     input_path = Path(args.input)
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    build = partial(build_example, include_features=args.include_features)
     emitted = 0
     skipped = 0
-    with output_path.open("w", encoding="utf-8") as handle:
-        for record in iter_jsonl(input_path):
-            example = build_example(record, include_features=args.include_features)
+    with ExitStack() as stack:
+        handle = stack.enter_context(output_path.open("w", encoding="utf-8"))
+        records = iter_jsonl(input_path)
+        if args.workers > 1:
+            # Records are independent; batches keep input order so output is stable.
+            pool = stack.enter_context(Pool(args.workers))
+            batch_size = args.workers * EXAMPLE_CHUNKSIZE * EXAMPLE_BATCH_CHUNKS
+            examples = pool_examples(pool, build, records, batch_size)
+        else:
+            examples = map(build, records)
+
+        for example in examples:
             if example is None:
                 skipped += 1
                 continue
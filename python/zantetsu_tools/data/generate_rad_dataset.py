@@ -12,9 +12,13 @@ Usage:
 
 import json
 import random
+import re
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 from ..common.anime_db import AnimeDbClient
 from ..common.jsonl import write_jsonl
 
@@ -86,6 +90,8 @@ EXTENSIONS = ["mkv", "mp4", "avi"]
 # Common sources
 SOURCES = ["WEB-DL", "BluRay", "BD", "HDTV", "DVD", "WEBRip"]
 
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+
 
 CLIENT = AnimeDbClient()
 
@@ -100,15 +106,40 @@ def fetch_all_titles(max_pages: int = 50) -> list[dict]:
     return CLIENT.fetch_all_anime_titles(max_pages=max_pages, page_size=500)
 
 
-def generate_crc32() -> str:
-    """Generate a random CRC32 hash."""
-    return "".join(random.choices("0123456789ABCDEF", k=8))
+@dataclass
+class MetadataDraws:
+    """Random metadata choices drawn in bulk, one row per synthetic filename."""
+
+    group: np.ndarray
+    episode: np.ndarray
+    resolution: np.ndarray
+    codec: np.ndarray
+    source: np.ndarray
+    extension: np.ndarray
+    crc32: np.ndarray
+    pattern: np.ndarray
+
+    @classmethod
+    def sample(
+        cls, count: int, rng: Optional[np.random.Generator] = None
+    ) -> "MetadataDraws":
+        # Seeded from `random`, so seeding `random` still reproduces the dataset.
+        rng = rng or np.random.default_rng(random.getrandbits(64))
+        return cls(
+            group=rng.integers(0, len(GROUPS), count),
+            # Most anime have 12-26 episodes per season
+            episode=rng.integers(1, 27, count),
+            resolution=rng.integers(0, len(RESOLUTIONS), count),
+            codec=rng.integers(0, len(VIDEO_CODECS), count),
+            source=rng.integers(0, len(SOURCES), count),
+            extension=rng.integers(0, len(EXTENSIONS), count),
+            crc32=rng.integers(0, 1 << 32, count),
+            pattern=rng.integers(0, len(PATTERNS), count),
+        )
 
 
 def clean_title(title) -> str:
     """Clean anime title for filename generation."""
-    import re
-
     # Handle case where title is a dict (API returns structured titles)
     if isinstance(title, dict):
         title = title.get("english") or title.get("romaji") or str(title)
@@ -116,7 +147,7 @@ def clean_title(title) -> str:
         title = str(title)
 
     # Remove HTML tags
-    title = re.sub(r"<[^>]+>", "", title)
+    title = HTML_TAG_RE.sub("", title)
 
     # Replace special characters
     title = title.replace(":", " -")
@@ -132,11 +163,8 @@ def clean_title(title) -> str:
     return title.strip()
 
 
-def generate_filename(
-    anime: dict, pattern_idx: Optional[int] = None
-) -> tuple[str, dict]:
-    """Generate a synthetic filename with metadata labels."""
-
+def resolve_title(anime: dict) -> str:
+    """Pick and clean the display title used in generated filenames."""
     # Get title from anime dict - handle different API response structures
     title_obj = anime.get("title", {})
 
@@ -165,18 +193,39 @@ def generate_filename(
     if len(title) < 3 or len(title) > 100:
         title = "Unknown Anime"
 
+    return title
+
+
+def generate_filename(
+    anime: dict,
+    pattern_idx: Optional[int] = None,
+    draws: Optional[MetadataDraws] = None,
+    row: int = 0,
+    title: Optional[str] = None,
+) -> tuple[str, dict]:
+    """Generate a synthetic filename with metadata labels.
+
+    Random choices are read from row `row` of `draws`; a single row is sampled
+    when no pre-drawn batch is given. Pass `title` from `resolve_title` to skip
+    re-cleaning when generating several filenames for the same anime.
+    """
+    if title is None:
+        title = resolve_title(anime)
+
     # Random metadata
-    group = random.choice(GROUPS)
-    episode = random.randint(1, 26)  # Most anime have 12-26 episodes per season
-    resolution = random.choice(RESOLUTIONS)
-    codec = random.choice(VIDEO_CODECS)
-    source = random.choice(SOURCES)
-    ext = random.choice(EXTENSIONS)
-    crc32 = generate_crc32()
+    if draws is None:
+        draws, row = MetadataDraws.sample(1), 0
+    group = GROUPS[draws.group[row]]
+    episode = int(draws.episode[row])
+    resolution = RESOLUTIONS[draws.resolution[row]]
+    codec = VIDEO_CODECS[draws.codec[row]]
+    source = SOURCES[draws.source[row]]
+    ext = EXTENSIONS[draws.extension[row]]
+    crc32 = f"{int(draws.crc32[row]):08X}"
 
     # Select pattern
     if pattern_idx is None:
-        pattern_idx = random.randint(0, len(PATTERNS) - 1)
+        pattern_idx = int(draws.pattern[row])
 
     pattern = PATTERNS[pattern_idx]
 
@@ -368,6 +417,19 @@ def generate_bio_tags(filename: str, metadata: dict) -> list[tuple[str, str]]:
     return tags, tokens
 
 
+def build_record(filename: str, metadata: dict, augmentation: str) -> dict:
+    """Tag a filename and package it as one dataset JSONL record."""
+    char_tags, token_tags = generate_bio_tags(filename, metadata)
+    return {
+        "filename": filename,
+        "tokens": [t for t, _ in token_tags],
+        "ner_tags": [tag for _, tag in token_tags],
+        "char_tags": char_tags,
+        "metadata": metadata,
+        "augmentation": augmentation,
+    }
+
+
 def main():
     import argparse
 
@@ -409,80 +471,62 @@ def main():
         f"Generating training data with {args.augmentations} augmentations per sample..."
     )
 
-    dataset = []
-    seen_filenames = set()
-
-    for i, anime in enumerate(titles):
-        if i % 100 == 0:
-            print(f"  Progress: {i}/{len(titles)} anime")
-
-        for _ in range(args.samples_per_anime):
-            filename, metadata = generate_filename(anime)
-
-            if filename in seen_filenames:
-                continue
-
-            seen_filenames.add(filename)
-
-            # Generate BIO tags
-            char_tags, token_tags = generate_bio_tags(filename, metadata)
-
-            dataset.append(
-                {
-                    "filename": filename,
-                    "tokens": [t for t, _ in token_tags],
-                    "ner_tags": [tag for _, tag in token_tags],
-                    "char_tags": char_tags,
-                    "metadata": metadata,
-                    "augmentation": "none",
-                }
-            )
-
-            # Apply RAD augmentations
-            if args.augmentations > 0:
-                augmented = apply_rad_augmentation(filename, metadata)
-                for aug_idx, (aug_filename, aug_meta) in enumerate(
-                    augmented[: args.augmentations]
-                ):
-                    if aug_filename not in seen_filenames:
-                        seen_filenames.add(aug_filename)
-                        aug_char_tags, aug_token_tags = generate_bio_tags(
-                            aug_filename, aug_meta
-                        )
-                        dataset.append(
-                            {
-                                "filename": aug_filename,
-                                "tokens": [t for t, _ in aug_token_tags],
-                                "ner_tags": [tag for _, tag in aug_token_tags],
-                                "char_tags": aug_char_tags,
-                                "metadata": aug_meta,
-                                "augmentation": f"rad_{aug_idx}",
-                            }
-                        )
-
-    # Save dataset
-    output_path = Path(args.output)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Records are written as they are generated, so statistics are tallied here
+    # instead of re-scanning an in-memory dataset afterwards.
+    augmented_samples = 0
+    entity_counts: dict[str, int] = {}
+    draws = MetadataDraws.sample(len(titles) * args.samples_per_anime)
+
+    def tally(record: dict) -> dict:
+        nonlocal augmented_samples
+        if record["augmentation"] != "none":
+            augmented_samples += 1
+        for tag in record["ner_tags"]:
+            if tag != "O":
+                entity_counts[tag] = entity_counts.get(tag, 0) + 1
+        return record
+
+    def iter_records():
+        seen_filenames = set()
+        for i, anime in enumerate(titles):
+            if i % 100 == 0:
+                print(f"  Progress: {i}/{len(titles)} anime")
+
+            title = resolve_title(anime)
+            for j in range(args.samples_per_anime):
+                filename, metadata = generate_filename(
+                    anime, draws=draws, row=i * args.samples_per_anime + j, title=title
+                )
+
+                if filename in seen_filenames:
+                    continue
+
+                seen_filenames.add(filename)
+                yield tally(build_record(filename, metadata, "none"))
+
+                # Apply RAD augmentations
+                if args.augmentations > 0:
+                    augmented = apply_rad_augmentation(filename, metadata)
+                    for aug_idx, (aug_filename, aug_meta) in enumerate(
+                        augmented[: args.augmentations]
+                    ):
+                        if aug_filename not in seen_filenames:
+                            seen_filenames.add(aug_filename)
+                            yield tally(
+                                build_record(aug_filename, aug_meta, f"rad_{aug_idx}")
+                            )
 
-    write_jsonl(output_path, dataset)
+    output_path = Path(args.output)
+    total_samples = write_jsonl(output_path, iter_records())
 
-    print(f"\nGenerated {len(dataset)} training samples")
+    print(f"\nGenerated {total_samples} training samples")
     print(f"Saved to {output_path}")
 
     # Print statistics
     print("\nDataset Statistics:")
-    print(f"  Total samples: {len(dataset)}")
+    print(f"  Total samples: {total_samples}")
     print(f"  Unique titles: {len(titles)}")
-    print(
-        f"  Augmented samples: {len([d for d in dataset if d['augmentation'] != 'none'])}"
-    )
-
-    # Count entity types
-    entity_counts = {}
-    for item in dataset:
-        for tag in item["ner_tags"]:
-            if tag != "O":
-                entity_counts[tag] = entity_counts.get(tag, 0) + 1
+    print(f"  Augmented samples: {augmented_samples}")
 
     print("\nEntity Distribution:")
     for entity, count in sorted(entity_counts.items()):
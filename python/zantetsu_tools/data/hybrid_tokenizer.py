@@ -4,7 +4,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import re
+import string
 from typing import Any
 
 
@@ -115,8 +117,7 @@ LEXICON_LOOKUP: dict[str, int] = {
     **{term: 8 for term in QUALITY_TERMS},
 }
 
-COMPOSITE_TOKEN_RE = re.compile(
-    r"""(?ix)
+COMPOSITE_TOKEN_PATTERN = r"""
     \d{1,4}-\d{1,4}
     |s\d{1,2}e\d{1,4}(?:v\d+)?
     |\d{1,4}v\d+
@@ -125,11 +126,29 @@ COMPOSITE_TOKEN_RE = re.compile(
     |h\.?26[45]|x26[45]|hevc|av1|vp9|flac|aac|opus|ac3|dts|mp3|truehd|eac3|vorbis
     |[A-Za-z0-9]+(?:'[A-Za-z0-9]+)*
     |[._+\-]
-    """
+"""
+COMPOSITE_TOKEN_RE = re.compile(COMPOSITE_TOKEN_PATTERN, re.IGNORECASE | re.VERBOSE)
+
+# One scanner for the whole filename: whitespace never matches, so `finditer`
+# skips it; anything that is not a bracket or composite token is a single char.
+SCAN_TOKEN_RE = re.compile(
+    rf"""
+    (?P<open>[\[({{])
+    |(?P<close>[\])}}])
+    |(?P<composite>{COMPOSITE_TOKEN_PATTERN})
+    |(?P<other>\S)
+    """,
+    re.IGNORECASE | re.VERBOSE,
 )
 
 SEASON_EPISODE_RE = re.compile(r"(?i)^(s\d{1,2})(e\d{1,4})(v\d+)?$")
+NUMBER_RANGE_RE = re.compile(r"^\d{1,4}-\d{1,4}$")
 VERSIONED_EPISODE_RE = re.compile(r"^(\d{1,4})(v\d+)$", re.IGNORECASE)
+# Deletion tables for the ASCII fast path in `token_shape`.
+DROP_ASCII_DIGITS = str.maketrans("", "", string.digits)
+DROP_ASCII_LETTERS = str.maketrans("", "", string.ascii_letters)
+# Token texts repeat heavily across filenames (groups, resolutions, codecs).
+TOKEN_CACHE_SIZE = 1 << 16
 ROMAN_NUMERAL_RE = re.compile(r"^(?=[ivxlcdm]+$)m{0,4}(cm|cd|d?c{0,3})(xc|xl|l?x{0,3})(ix|iv|v?i{0,3})$", re.IGNORECASE)
 
 
@@ -145,28 +164,29 @@ class HybridToken:
     shape: str
 
     def to_feature_dict(self) -> dict[str, Any]:
+        normalized = self.normalized
         return {
             "token": self.text,
-            "lower": self.normalized,
+            "lower": normalized,
             "shape": self.shape,
             "inside_brackets": self.inside_brackets,
             "bracket_kind": self.bracket_kind,
-            "is_resolution": self.normalized in RESOLUTION_TERMS,
-            "is_source": self.normalized in SOURCE_TERMS,
-            "is_codec": self.normalized in CODEC_TERMS,
-            "is_audio": self.normalized in AUDIO_TERMS,
-            "is_language": self.normalized in LANGUAGE_TERMS,
-            "is_subtitle": self.normalized in SUBTITLE_TERMS,
-            "is_quality": self.normalized in QUALITY_TERMS,
-            "is_container": self.normalized in CONTAINER_TERMS,
+            "is_resolution": normalized in RESOLUTION_TERMS,
+            "is_source": normalized in SOURCE_TERMS,
+            "is_codec": normalized in CODEC_TERMS,
+            "is_audio": normalized in AUDIO_TERMS,
+            "is_language": normalized in LANGUAGE_TERMS,
+            "is_subtitle": normalized in SUBTITLE_TERMS,
+            "is_quality": normalized in QUALITY_TERMS,
+            "is_container": normalized in CONTAINER_TERMS,
             "contains_dash": "-" in self.text,
-            "is_numeric": self.normalized.isdigit(),
-            "is_alnum": self.normalized.isalnum(),
-            "is_roman_numeral": is_roman_numeral(self.normalized),
-            "prefix2": self.normalized[:2],
-            "prefix4": self.normalized[:4],
-            "suffix2": self.normalized[-2:],
-            "suffix4": self.normalized[-4:],
+            "is_numeric": normalized.isdigit(),
+            "is_alnum": normalized.isalnum(),
+            "is_roman_numeral": is_roman_numeral(normalized),
+            "prefix2": normalized[:2],
+            "prefix4": normalized[:4],
+            "suffix2": normalized[-2:],
+            "suffix4": normalized[-4:],
         }
 
 
@@ -174,16 +194,18 @@ def normalize_token(token: str) -> str:
     return token.strip().lower()
 
 
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
 def is_roman_numeral(text: str) -> bool:
     return bool(text) and bool(ROMAN_NUMERAL_RE.fullmatch(text))
 
 
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
 def token_shape(token: str) -> str:
     if not token:
         return "EMPTY"
     if token.isdigit():
         return "NUM"
-    if re.fullmatch(r"\d{1,4}-\d{1,4}", token):
+    if NUMBER_RANGE_RE.fullmatch(token):
         return "RANGE"
     if is_roman_numeral(token):
         return "ROMAN"
@@ -193,6 +215,14 @@ def token_shape(token: str) -> str:
         return "TITLE"
     if "-" in token:
         return "DASHED"
+    if token.isascii():
+        # Deleting ASCII digits/letters in C changes the length iff any were present.
+        length = len(token)
+        if len(token.translate(DROP_ASCII_DIGITS)) != length and len(
+            token.translate(DROP_ASCII_LETTERS)
+        ) != length:
+            return "ALNUM"
+        return "MIXED"
     if any(character.isdigit() for character in token) and any(
         character.isalpha() for character in token
     ):
@@ -200,7 +230,7 @@ def token_shape(token: str) -> str:
     return "MIXED"
 
 
-def _position_bucket(index: int, total: int) -> str:
+def position_bucket(index: int, total: int) -> str:
     if total <= 1:
         return "singleton"
     if index <= 1:
@@ -265,39 +295,27 @@ def _split_composite_token(text: str, start: int, end: int) -> list[tuple[str, i
 def tokenize_filename(text: str) -> list[HybridToken]:
     tokens: list[HybridToken] = []
     bracket_stack: list[str] = []
-    cursor = 0
     index = 0
 
-    while cursor < len(text):
-        character = text[cursor]
-
-        if character.isspace():
-            cursor += 1
-            continue
+    for match in SCAN_TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        piece_text = match.group()
+        start, end = match.span()
 
-        if character in OPEN_BRACKETS:
-            tokens.append(_make_token(character, cursor, cursor + 1, index, bracket_stack))
-            bracket_stack.append(character)
-            cursor += 1
+        if kind == "open" or kind == "close":
+            tokens.append(_make_token(piece_text, start, end, index, bracket_stack))
             index += 1
-            continue
-
-        if character in CLOSE_BRACKETS:
-            tokens.append(_make_token(character, cursor, cursor + 1, index, bracket_stack))
-            opener = CLOSE_BRACKETS[character]
-            if bracket_stack and bracket_stack[-1] == opener:
+            if kind == "open":
+                bracket_stack.append(piece_text)
+            elif bracket_stack and bracket_stack[-1] == CLOSE_BRACKETS[piece_text]:
                 bracket_stack.pop()
-            cursor += 1
-            index += 1
             continue
 
-        match = COMPOSITE_TOKEN_RE.match(text, cursor)
-        if match is None:
-            pieces = [(character, cursor, cursor + 1)]
-            cursor += 1
+        # Only composites ending in a digit can be `S01E02`/`12v2` style splits.
+        if kind == "composite" and piece_text[-1].isdigit():
+            pieces = _split_composite_token(text, start, end)
         else:
-            cursor = match.end()
-            pieces = _split_composite_token(text, match.start(), match.end())
+            pieces = [(piece_text, start, end)]
 
         for piece_text, piece_start, piece_end in pieces:
             if not piece_text.strip():
@@ -320,7 +338,7 @@ def build_context_features(tokens: list[HybridToken]) -> list[dict[str, Any]]:
             {
                 "previous_token": tokens[index - 1].normalized if index > 0 else "<BOS>",
                 "next_token": tokens[index + 1].normalized if index + 1 < total else "<EOS>",
-                "position_bucket": _position_bucket(index, total),
+                "position_bucket": position_bucket(index, total),
             }
         )
         features.append(token_features)
@@ -328,13 +346,32 @@ def build_context_features(tokens: list[HybridToken]) -> list[dict[str, Any]]:
     return features
 
 
+def bracket_kinds_from_texts(token_texts: list[str]) -> list[str | None]:
+    """Innermost open bracket enclosing each token, or None outside brackets."""
+    bracket_kinds: list[str | None] = []
+    bracket_stack: list[str] = []
+
+    for token_text in token_texts:
+        bracket_kinds.append(bracket_stack[-1] if bracket_stack else None)
+
+        if token_text in OPEN_BRACKETS:
+            bracket_stack.append(token_text)
+        elif token_text in CLOSE_BRACKETS:
+            opener = CLOSE_BRACKETS[token_text]
+            if bracket_stack and bracket_stack[-1] == opener:
+                bracket_stack.pop()
+
+    return bracket_kinds
+
+
 def build_context_features_from_texts(token_texts: list[str]) -> list[dict[str, Any]]:
     """Rebuild token features from already tokenized text without re-tokenizing the filename."""
     rebuilt_tokens: list[HybridToken] = []
-    bracket_stack: list[str] = []
     cursor = 0
 
-    for index, token_text in enumerate(token_texts):
+    for index, (token_text, bracket_kind) in enumerate(
+        zip(token_texts, bracket_kinds_from_texts(token_texts))
+    ):
         rebuilt_tokens.append(
             HybridToken(
                 text=token_text,
@@ -342,19 +379,11 @@ def build_context_features_from_texts(token_texts: list[str]) -> list[dict[str,
                 start=cursor,
                 end=cursor + len(token_text),
                 index=index,
-                inside_brackets=bool(bracket_stack),
-                bracket_kind=bracket_stack[-1] if bracket_stack else None,
+                inside_brackets=bracket_kind is not None,
+                bracket_kind=bracket_kind,
                 shape=token_shape(token_text),
             )
         )
-
-        if token_text in OPEN_BRACKETS:
-            bracket_stack.append(token_text)
-        elif token_text in CLOSE_BRACKETS:
-            opener = CLOSE_BRACKETS[token_text]
-            if bracket_stack and bracket_stack[-1] == opener:
-                bracket_stack.pop()
-
         cursor += len(token_text)
 
     return build_context_features(rebuilt_tokens)
@@ -15,7 +15,6 @@ Architecture:
 Outputs ONNX model for Rust inference.
 """
 
-import json
 import random
 import re
 import time
@@ -32,6 +31,7 @@ from torch.optim import AdamW
 from torch.optim.lr_scheduler import OneCycleLR
 import numpy as np
 
+from ..common.jsonl import loads_json
 from ..common.torch_runtime import configure_torch_runtime
 
 
@@ -64,9 +64,20 @@ CHAR_VOCAB = {chr(i): i - 30 for i in range(32, 127)}  # ASCII 32->1, ..., 126->
 CHAR_VOCAB["<PAD>"] = 0
 CHAR_VOCAB["<UNK>"] = 96
 NUM_CHARS = 97
+# Byte -> index lookup so ASCII text can be encoded with bytes.translate
+CHAR_ENCODE_TABLE = bytes(
+    CHAR_VOCAB.get(chr(i), CHAR_VOCAB["<UNK>"]) for i in range(256)
+)
 
 MAX_LEN = 256
 
+# Delimiters rewritten by RADAugmenter.random_spacing_variation
+SPACING_PATTERNS = (
+    (" ", re.compile(r"\s+")),
+    ("-", re.compile(r"\s*-\s*")),
+    (".", re.compile(r"\s*\.\s*")),
+)
+
 
 def iter_tensor_batches(
     chars: torch.Tensor,
@@ -98,7 +109,12 @@ def pad_seq(seq: List[int], max_len: int) -> List[int]:
 
 def char_encode(text: str) -> List[int]:
     """Encode text as character indices."""
-    indices = [CHAR_VOCAB.get(c, CHAR_VOCAB["<UNK>"]) for c in text[: MAX_LEN - 2]]
+    text = text[: MAX_LEN - 2]
+    if text.isascii():
+        indices = list(text.encode("ascii").translate(CHAR_ENCODE_TABLE))
+    else:
+        unk = CHAR_VOCAB["<UNK>"]
+        indices = [CHAR_VOCAB.get(c, unk) for c in text]
     return pad_seq(indices, MAX_LEN)
 
 
@@ -126,13 +142,13 @@ class AnimeFilenameDataset(Dataset):
 
     def _load_data(self, filepath: str, max_samples: Optional[int]):
         print(f"Loading data from {filepath}...")
-        with open(filepath, "r", encoding="utf-8") as f:
+        with open(filepath, "rb") as f:
             for i, line in enumerate(f):
                 if max_samples and i >= max_samples:
                     break
                 if i % 50000 == 0 and i > 0:
                     print(f"  Loaded {i} samples...")
-                data = json.loads(line)
+                data = loads_json(line)
                 filename = data["filename"]
                 char_indices = char_encode(filename)
                 tags = parse_char_tags(data["char_tags"], filename)
@@ -176,22 +192,28 @@ def build_training_tensors(
 
     if aug_ratio > 0:
         print(f"Applying RAD augmentation (ratio={aug_ratio:.2f})...")
-        augmented_count = 0
         augment_started_at = time.perf_counter()
 
-        for idx, sample in enumerate(base_dataset.samples, start=1):
-            if sample.filename and random.random() < aug_ratio:
-                all_chars[idx - 1] = np.asarray(
-                    char_encode(augmenter.augment(sample.filename)),
-                    dtype=np.int64,
-                )
-                augmented_count += 1
+        # Draw every sample's augmentation coin in one call, then only visit the winners.
+        # The generator is seeded from `random`, so seeding `random` still reproduces the data.
+        rng = np.random.default_rng(random.getrandbits(64))
+        has_filename = np.fromiter(
+            (bool(sample.filename) for sample in base_dataset.samples),
+            dtype=bool,
+            count=total_samples,
+        )
+        selected = np.flatnonzero(
+            (rng.random(total_samples) < aug_ratio) & has_filename
+        )
 
-            if idx % 10000 == 0 or idx == total_samples:
+        for done, idx in enumerate(selected, start=1):
+            all_chars[idx] = char_encode(augmenter.augment(base_dataset.samples[idx].filename))
+
+            if done % 10000 == 0 or done == len(selected):
                 elapsed = time.perf_counter() - augment_started_at
                 print(
-                    f"  Augmented {idx}/{total_samples} samples in {elapsed:.1f}s "
-                    f"({augmented_count} modified)"
+                    f"  Augmented {done}/{len(selected)} selected samples in {elapsed:.1f}s "
+                    f"({total_samples} total)"
                 )
 
     return torch.from_numpy(all_chars), torch.from_numpy(all_tags)
@@ -370,14 +392,14 @@ class CrfLayer(nn.Module):
 
         # Initialize with start transitions + first emission
         score = self.start_transitions + emissions[:, 0]  # [batch, num_tags]
+        # transitions: [num_tags_prev, num_tags] -> [1, num_tags_prev, num_tags]
+        broadcast_transitions = self.transitions.unsqueeze(0)  # [1, tags, tags]
 
         for i in range(1, seq_len):
             # score: [batch, num_tags_prev]
             # expand: [batch, num_tags_prev, 1]
-            # transitions: [num_tags_prev, num_tags] -> [1, num_tags_prev, num_tags]
             # emissions[:, i]: [batch, num_tags] -> [batch, 1, num_tags]
             broadcast_score = score.unsqueeze(2)  # [batch, tags, 1]
-            broadcast_transitions = self.transitions.unsqueeze(0)  # [1, tags, tags]
             broadcast_emissions = emissions[:, i].unsqueeze(1)  # [batch, 1, tags]
 
             next_score = broadcast_score + broadcast_transitions + broadcast_emissions
@@ -456,11 +478,10 @@ def viterbi_decode(
 
     score = start_transitions + emissions[:, 0, :]
     history = []
+    broadcast_transitions = transitions.unsqueeze(0)
 
     for i in range(1, seq_len):
         broadcast_score = score.unsqueeze(2)
-        broadcast_transitions = transitions.unsqueeze(0)
-
         next_score = broadcast_score + broadcast_transitions
         next_score, indices = next_score.max(dim=1)
 
@@ -469,14 +490,16 @@ def viterbi_decode(
         history.append(indices)
 
     score = score + end_transitions
-    _, best_last_tags = score.max(dim=1)
 
-    best_tags = [best_last_tags.tolist()]
-    for hist in reversed(history):
-        best_last_tags = hist.gather(1, best_last_tags.unsqueeze(1)).squeeze(1)
-        best_tags.insert(0, best_last_tags.tolist())
+    # Backtrack on-device into one tensor and convert to Python lists once.
+    best_path = torch.empty(
+        (batch_size, seq_len), dtype=torch.long, device=emissions.device
+    )
+    best_path[:, -1] = score.max(dim=1).indices
+    for i in range(seq_len - 2, -1, -1):
+        best_path[:, i] = history[i].gather(1, best_path[:, i + 1 : i + 2]).squeeze(1)
 
-    return [list(sequence) for sequence in zip(*best_tags)]
+    return best_path.tolist()
 
 
 class RADAugmenter:
@@ -611,16 +634,11 @@ class RADAugmenter:
             return text
 
         result = text
-        for delim in [" ", "-", "."]:
-            if delim == " ":
-                pattern = r"(\s+)" if delim == " " else r"(\s*\.\s*)"
-            else:
-                pattern = rf"(\s*\{delim}\s*)"
-
+        for delim, pattern in SPACING_PATTERNS:
             if random.random() < 0.5:
-                result = re.sub(pattern, delim, result)
+                result = pattern.sub(delim, result)
             else:
-                result = re.sub(pattern, f" {delim} ", result)
+                result = pattern.sub(f" {delim} ", result)
 
         return result.strip()
 
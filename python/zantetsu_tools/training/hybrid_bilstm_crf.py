@@ -6,7 +6,10 @@ from __future__ import annotations
 import argparse
 from collections import Counter
 from dataclasses import dataclass
+import hashlib
+from itertools import islice
 import json
+import os
 import random
 from pathlib import Path
 from typing import Any
@@ -15,14 +18,17 @@ import torch
 import torch.nn as nn
 import torch.nn.functional as F
 from torch.optim import AdamW
-from torch.utils.data import DataLoader, Dataset
+from torch.utils.data import DataLoader, Dataset, Sampler
 
 from ..common.jsonl import iter_jsonl
-from ..common.torch_runtime import configure_torch_runtime
+from ..common.paths import DATA_DIR
+from ..common.torch_runtime import configure_torch_runtime, resolve_amp_dtype
+from ..data import hybrid_tokenizer
 from ..data.hybrid_tokenizer import (
     LEXICON_CATEGORIES,
     LEXICON_LOOKUP,
-    build_context_features_from_texts,
+    bracket_kinds_from_texts,
+    position_bucket,
 )
 
 
@@ -33,21 +39,32 @@ UNK_CHAR = "<UNK>"
 
 BRACKET_TO_ID = {None: 0, "[": 1, "(": 2, "{": 3}
 POSITION_TO_ID = {"singleton": 0, "start": 1, "middle": 2, "end": 3}
+# Bump when the cache layout changes; edits to the encoding code are picked up by
+# hashing its source (see `encoding_source_digest`).
+DATASET_CACHE_VERSION = 2
+# Most recently used caches kept in the cache directory; older ones are evicted.
+DATASET_CACHE_KEEP = 4
+# Only files with this suffix are ever evicted, so a shared directory keeps its checkpoints.
+DATASET_CACHE_SUFFIX = ".hybrid-cache.pt"
+
+
 def load_dataset(path: Path, max_samples: int = 0) -> list[dict[str, Any]]:
-    records = list(iter_jsonl(path))
-    return records[:max_samples] if max_samples else records
+    # Stop reading once max_samples records are parsed instead of slicing afterwards.
+    return list(islice(iter_jsonl(path), max_samples or None))
 
 
-def build_vocab(records: list[dict[str, Any]], min_freq: int) -> tuple[dict[str, int], dict[str, int], dict[str, int]]:
+def build_vocab(
+    records: list[dict[str, Any]], min_freq: int
+) -> tuple[dict[str, int], dict[str, int], dict[str, int], Counter[str]]:
     token_counter: Counter[str] = Counter()
     char_counter: Counter[str] = Counter()
-    labels: set[str] = {"O"}
+    label_counter: Counter[str] = Counter()
 
     for record in records:
         for token in record["tokens"]:
             token_counter[token.lower()] += 1
             char_counter.update(token)
-        labels.update(record["tags"])
+        label_counter.update(record["tags"])
 
     token_vocab = {PAD_TOKEN: 0, UNK_TOKEN: 1}
     for token, count in token_counter.items():
@@ -58,8 +75,9 @@ def build_vocab(records: list[dict[str, Any]], min_freq: int) -> tuple[dict[str,
     for char, _ in char_counter.most_common():
         char_vocab[char] = len(char_vocab)
 
+    labels = {"O", *label_counter}
     label_vocab = {label: index for index, label in enumerate(sorted(labels))}
-    return token_vocab, char_vocab, label_vocab
+    return token_vocab, char_vocab, label_vocab, label_counter
 
 
 def split_records(records: list[dict[str, Any]], validation_ratio: float, seed: int) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
@@ -101,25 +119,44 @@ class HybridDataset(Dataset):
         for record in records:
             self.samples.append(self.encode_record(record))
 
+    @classmethod
+    def from_samples(
+        cls,
+        samples: list[EncodedSample],
+        token_vocab: dict[str, int],
+        char_vocab: dict[str, int],
+        label_vocab: dict[str, int],
+        max_char_len: int,
+    ) -> HybridDataset:
+        dataset = cls([], token_vocab, char_vocab, label_vocab, max_char_len)
+        dataset.samples = samples
+        return dataset
+
     def encode_record(self, record: dict[str, Any]) -> EncodedSample:
         tokens = record["tokens"]
         tags = record["tags"]
 
+        # Only the bracket and position columns are used, so skip building full
+        # feature dicts when the record doesn't carry them.
         features = record.get("features")
         if features is None:
-            features = build_context_features_from_texts(tokens)
-
-        token_ids = [self.token_vocab.get(token.lower(), self.token_vocab[UNK_TOKEN]) for token in tokens]
+            bracket_kinds = bracket_kinds_from_texts(tokens)
+            position_buckets = [position_bucket(index, len(tokens)) for index in range(len(tokens))]
+        else:
+            bracket_kinds = [
+                feature["bracket_kind"] if feature["inside_brackets"] else None for feature in features
+            ]
+            position_buckets = [feature["position_bucket"] for feature in features]
+
+        lowered = [token.lower() for token in tokens]
+        token_ids = [self.token_vocab.get(token, self.token_vocab[UNK_TOKEN]) for token in lowered]
         char_ids = [
             [self.char_vocab.get(char, self.char_vocab[UNK_CHAR]) for char in token[: self.max_char_len]]
             for token in tokens
         ]
-        bracket_ids = [
-            BRACKET_TO_ID[feature["bracket_kind"] if feature["inside_brackets"] else None]
-            for feature in features
-        ]
-        position_ids = [POSITION_TO_ID[feature["position_bucket"]] for feature in features]
-        lexicon_ids = [LEXICON_LOOKUP.get(token.lower(), 0) for token in tokens]
+        bracket_ids = [BRACKET_TO_ID[kind] for kind in bracket_kinds]
+        position_ids = [POSITION_TO_ID[bucket] for bucket in position_buckets]
+        lexicon_ids = [LEXICON_LOOKUP.get(token, 0) for token in lowered]
         label_ids = [self.label_vocab[tag] for tag in tags]
 
         return EncodedSample(token_ids, char_ids, bracket_ids, position_ids, lexicon_ids, label_ids)
@@ -131,6 +168,40 @@ class HybridDataset(Dataset):
         return self.samples[index]
 
 
+class LengthGroupedBatchSampler(Sampler[list[int]]):
+    """Shuffled batches of similar-length samples, so each batch pads as little as possible.
+
+    Indices are shuffled, cut into chunks of `mega_batch_factor` batches, sorted by length
+    within each chunk and split into batches; the batch order is then shuffled again.
+    """
+
+    def __init__(self, lengths: list[int], batch_size: int, seed: int, mega_batch_factor: int = 50):
+        self.lengths = lengths
+        self.batch_size = batch_size
+        self.seed = seed
+        self.mega_batch_factor = mega_batch_factor
+        self.epoch = 0
+
+    def __iter__(self):
+        rng = random.Random(self.seed + self.epoch)
+        self.epoch += 1
+
+        indices = list(range(len(self.lengths)))
+        rng.shuffle(indices)
+        mega_batch_size = self.batch_size * self.mega_batch_factor
+        batches: list[list[int]] = []
+        for start in range(0, len(indices), mega_batch_size):
+            chunk = sorted(indices[start : start + mega_batch_size], key=self.lengths.__getitem__)
+            batches.extend(
+                chunk[offset : offset + self.batch_size] for offset in range(0, len(chunk), self.batch_size)
+            )
+        rng.shuffle(batches)
+        return iter(batches)
+
+    def __len__(self) -> int:
+        return (len(self.lengths) + self.batch_size - 1) // self.batch_size
+
+
 def collate_batch(batch: list[EncodedSample]) -> dict[str, torch.Tensor]:
     batch_size = len(batch)
     max_seq_len = max(len(sample.token_ids) for sample in batch)
@@ -226,10 +297,10 @@ class LinearChainCrf(nn.Module):
 
     def compute_normalizer(self, emissions: torch.Tensor, mask: torch.Tensor) -> torch.Tensor:
         score = self._masked_start_transitions() + emissions[:, 0]
+        broadcast_transitions = self._masked_transitions().unsqueeze(0)
 
         for timestep in range(1, emissions.size(1)):
             broadcast_score = score.unsqueeze(2)
-            broadcast_transitions = self._masked_transitions().unsqueeze(0)
             broadcast_emission = emissions[:, timestep].unsqueeze(1)
             next_score = broadcast_score + broadcast_transitions + broadcast_emission
             next_score = torch.logsumexp(next_score, dim=1)
@@ -243,10 +314,11 @@ class LinearChainCrf(nn.Module):
         batch_size, seq_len, _ = emissions.shape
         score = self._masked_start_transitions() + emissions[:, 0]
         history: list[torch.Tensor] = []
+        broadcast_transitions = self._masked_transitions().unsqueeze(0)
 
         for timestep in range(1, seq_len):
             broadcast_score = score.unsqueeze(2)
-            next_score = broadcast_score + self._masked_transitions().unsqueeze(0)
+            next_score = broadcast_score + broadcast_transitions
             next_score, indices = next_score.max(dim=1)
             next_score = next_score + emissions[:, timestep]
             timestep_mask = mask[:, timestep].unsqueeze(1)
@@ -254,16 +326,16 @@ class LinearChainCrf(nn.Module):
             history.append(indices)
 
         score = score + self.end_transitions
-        best_last_tags = score.argmax(dim=1)
 
-        best_tags = [best_last_tags.tolist()]
-        for hist in reversed(history):
-            best_last_tags = hist.gather(1, best_last_tags.unsqueeze(1)).squeeze(1)
-            best_tags.insert(0, best_last_tags.tolist())
+        # Backtrack on-device into one tensor and convert to Python lists once.
+        best_path = torch.empty((batch_size, seq_len), dtype=torch.long, device=emissions.device)
+        best_path[:, -1] = score.argmax(dim=1)
+        for timestep in range(seq_len - 2, -1, -1):
+            previous = history[timestep].gather(1, best_path[:, timestep + 1 : timestep + 2])
+            best_path[:, timestep] = previous.squeeze(1)
 
-        sequences = [list(sequence) for sequence in zip(*best_tags)]
         lengths = mask.long().sum(dim=1).tolist()
-        return [sequence[:length] for sequence, length in zip(sequences, lengths)]
+        return [sequence[:length] for sequence, length in zip(best_path.tolist(), lengths)]
 
 
 class HybridBiLstmCrf(nn.Module):
@@ -333,7 +405,8 @@ class HybridBiLstmCrf(nn.Module):
         encoded_input = self.dropout(encoded_input)
         encoded_output, _ = self.encoder(encoded_input)
         encoded_output = self.dropout(encoded_output)
-        emissions = self.classifier(encoded_output)
+        # The CRF always runs in fp32, even when the encoder runs under autocast.
+        emissions = self.classifier(encoded_output).float()
         emissions = emissions.masked_fill(~mask.unsqueeze(-1), -1e4)
 
         if labels is None:
@@ -494,6 +567,8 @@ def run_epoch(
     device: torch.device,
     aux_ce_weight: float = 0.0,
     class_weights: torch.Tensor | None = None,
+    amp_dtype: torch.dtype | None = None,
+    scaler: torch.amp.GradScaler | None = None,
 ) -> float:
     model.train()
     total_loss = 0.0
@@ -505,30 +580,37 @@ def run_epoch(
         }
         optimizer.zero_grad(set_to_none=True)
 
-        # Get emissions, then compute CRF loss
-        emissions = model(
-            batch["token_ids"],
-            batch["char_ids"],
-            batch["bracket_ids"],
-            batch["position_ids"],
-            batch["lexicon_ids"],
-            batch["mask"],
-        )
-        loss = model.crf(emissions, batch["labels"], batch["mask"])
-
-        if aux_ce_weight > 0.0:
-            # Auxiliary per-token CE loss on emission scores (bypasses CRF)
-            # This gives direct gradient to the emission classifier for rare labels
-            active = batch["mask"].reshape(-1)
-            active_em = emissions.reshape(-1, emissions.size(-1))[active]
-            active_labels = batch["labels"].reshape(-1)[active]
-            w = class_weights.to(device) if class_weights is not None else None
-            ce_loss = F.cross_entropy(active_em, active_labels, weight=w)
-            loss = loss + aux_ce_weight * ce_loss
-
-        loss.backward()
-        torch.nn.utils.clip_grad_norm_(model.parameters(), 1.0)
-        optimizer.step()
+        with torch.autocast(device.type, dtype=amp_dtype, enabled=amp_dtype is not None):
+            # Get emissions, then compute CRF loss
+            emissions = model(
+                batch["token_ids"],
+                batch["char_ids"],
+                batch["bracket_ids"],
+                batch["position_ids"],
+                batch["lexicon_ids"],
+                batch["mask"],
+            )
+            loss = model.crf(emissions, batch["labels"], batch["mask"])
+
+            if aux_ce_weight > 0.0:
+                # Auxiliary per-token CE loss on emission scores (bypasses CRF)
+                # This gives direct gradient to the emission classifier for rare labels
+                active = batch["mask"].reshape(-1)
+                active_em = emissions.reshape(-1, emissions.size(-1))[active]
+                active_labels = batch["labels"].reshape(-1)[active]
+                ce_loss = F.cross_entropy(active_em, active_labels, weight=class_weights)
+                loss = loss + aux_ce_weight * ce_loss
+
+        if scaler is not None:
+            scaler.scale(loss).backward()
+            scaler.unscale_(optimizer)
+            torch.nn.utils.clip_grad_norm_(model.parameters(), 1.0)
+            scaler.step(optimizer)
+            scaler.update()
+        else:
+            loss.backward()
+            torch.nn.utils.clip_grad_norm_(model.parameters(), 1.0)
+            optimizer.step()
         total_loss += loss.item()
 
     return total_loss / max(1, len(dataloader))
@@ -539,6 +621,7 @@ def evaluate(
     dataloader: DataLoader,
     device: torch.device,
     id_to_label: dict[int, str],
+    amp_dtype: torch.dtype | None = None,
 ) -> tuple[float, dict[str, float]]:
     model.eval()
     total_loss = 0.0
@@ -546,7 +629,9 @@ def evaluate(
     labels: list[list[int]] = []
     masks: list[list[bool]] = []
 
-    with torch.no_grad():
+    with torch.no_grad(), torch.autocast(
+        device.type, dtype=amp_dtype, enabled=amp_dtype is not None
+    ):
         for batch in dataloader:
             batch = {
                 key: value.to(device, non_blocking=device.type == "cuda")
@@ -618,6 +703,122 @@ def save_artifacts(
     )
 
 
+PreparedDatasets = tuple[
+    dict[str, int], dict[str, int], dict[str, int], Counter[str], HybridDataset, HybridDataset
+]
+
+
+def encoding_source_digest() -> str:
+    """Hash the tokenizer and trainer sources, whose code decides how records are encoded."""
+    digest = hashlib.sha256()
+    for module_path in (hybrid_tokenizer.__file__, __file__):
+        digest.update(Path(module_path).read_bytes())
+    return digest.hexdigest()
+
+
+def dataset_cache_path(args: argparse.Namespace) -> Path:
+    """Cache file for the encoded datasets, keyed by the input file, the encoding code and every option that shapes them."""
+    stat = args.data.stat()
+    fingerprint = json.dumps(
+        [
+            DATASET_CACHE_VERSION,
+            encoding_source_digest(),
+            str(args.data.resolve()),
+            stat.st_size,
+            stat.st_mtime_ns,
+            args.max_samples,
+            args.validation_ratio,
+            args.seed,
+            args.min_token_freq,
+            args.max_char_len,
+        ]
+    )
+    digest = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:16]
+    return args.dataset_cache_dir / f"{args.data.stem}-{digest}{DATASET_CACHE_SUFFIX}"
+
+
+def build_datasets(args: argparse.Namespace) -> PreparedDatasets:
+    print(f"Loading records from {args.data}...", flush=True)
+    records = load_dataset(args.data, args.max_samples)
+    if not records:
+        raise SystemExit(f"No training records found in {args.data}")
+    print(f"Loaded {len(records):,} records", flush=True)
+
+    print("Splitting train/validation sets...", flush=True)
+    train_records, validation_records = split_records(records, args.validation_ratio, args.seed)
+
+    print("Building vocabularies...", flush=True)
+    token_vocab, char_vocab, label_vocab, label_token_counts = build_vocab(
+        train_records, args.min_token_freq
+    )
+
+    print("Encoding training dataset...", flush=True)
+    train_dataset = HybridDataset(
+        train_records, token_vocab, char_vocab, label_vocab, args.max_char_len
+    )
+    print("Encoding validation dataset...", flush=True)
+    validation_dataset = HybridDataset(
+        validation_records, token_vocab, char_vocab, label_vocab, args.max_char_len
+    )
+    return token_vocab, char_vocab, label_vocab, label_token_counts, train_dataset, validation_dataset
+
+
+def sample_fields(sample: EncodedSample) -> tuple[Any, ...]:
+    # Unlike dataclasses.astuple, this does not deep-copy every nested list.
+    return (
+        sample.token_ids,
+        sample.char_ids,
+        sample.bracket_ids,
+        sample.position_ids,
+        sample.lexicon_ids,
+        sample.label_ids,
+    )
+
+
+def save_dataset_cache(path: Path, prepared: PreparedDatasets) -> None:
+    token_vocab, char_vocab, label_vocab, label_token_counts, train_dataset, validation_dataset = prepared
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Plain containers only, so the cache also loads under torch.load(weights_only=True).
+    payload = {
+        "token_vocab": token_vocab,
+        "char_vocab": char_vocab,
+        "label_vocab": label_vocab,
+        "label_token_counts": dict(label_token_counts),
+        "train": [sample_fields(sample) for sample in train_dataset.samples],
+        "validation": [sample_fields(sample) for sample in validation_dataset.samples],
+    }
+    temp_path = path.with_suffix(".tmp")
+    torch.save(payload, temp_path)
+    temp_path.replace(path)
+    evict_dataset_caches(path.parent)
+
+
+def evict_dataset_caches(cache_dir: Path, keep: int = DATASET_CACHE_KEEP) -> None:
+    """Delete all but the `keep` most recently used caches; loading a cache refreshes its mtime."""
+    caches = sorted(cache_dir.glob(f"*{DATASET_CACHE_SUFFIX}"), key=lambda cache: cache.stat().st_mtime_ns, reverse=True)
+    for stale in caches[keep:]:
+        stale.unlink(missing_ok=True)
+
+
+def load_dataset_cache(path: Path, max_char_len: int) -> PreparedDatasets:
+    payload = torch.load(path)
+    os.utime(path)
+    token_vocab = payload["token_vocab"]
+    char_vocab = payload["char_vocab"]
+    label_vocab = payload["label_vocab"]
+    datasets = [
+        HybridDataset.from_samples(
+            [EncodedSample(*fields) for fields in payload[split]],
+            token_vocab,
+            char_vocab,
+            label_vocab,
+            max_char_len,
+        )
+        for split in ("train", "validation")
+    ]
+    return token_vocab, char_vocab, label_vocab, Counter(payload["label_token_counts"]), *datasets
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Train a hybrid BiLSTM-CRF parser")
     parser.add_argument(
@@ -642,6 +843,31 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--seed", type=int, default=42)
     parser.add_argument("--device", default="cuda" if torch.cuda.is_available() else "cpu")
     parser.add_argument("--num-workers", type=int, default=4)
+    parser.add_argument(
+        "--no-length-grouping",
+        action="store_true",
+        help="Shuffle training batches uniformly instead of grouping samples of similar length",
+    )
+    parser.add_argument(
+        "--precision",
+        choices=("auto", "bf16", "fp16", "fp32"),
+        default="auto",
+        help="Autocast precision on CUDA; auto picks bf16 where supported, else fp16 (CPU always trains in fp32)",
+    )
+    parser.add_argument(
+        "--dataset-cache-dir",
+        default=DATA_DIR / "training" / ".hybrid_cache",
+        type=Path,
+        help=(
+            "Directory for encoded dataset caches, reused while the data file, encoding code and options are "
+            f"unchanged; only the {DATASET_CACHE_KEEP} most recently used caches are kept"
+        ),
+    )
+    parser.add_argument(
+        "--no-dataset-cache",
+        action="store_true",
+        help="Always re-encode the dataset and don't write a cache",
+    )
     parser.add_argument(
         "--aux-ce-weight",
         type=float,
@@ -656,21 +882,21 @@ def main() -> None:
     random.seed(args.seed)
     torch.manual_seed(args.seed)
 
-    print(f"Loading records from {args.data}...", flush=True)
-    records = load_dataset(args.data, args.max_samples)
-    if not records:
-        raise SystemExit(f"No training records found in {args.data}")
-    print(f"Loaded {len(records):,} records", flush=True)
-
-    print("Splitting train/validation sets...", flush=True)
-    train_records, validation_records = split_records(records, args.validation_ratio, args.seed)
+    cache_path = None if args.no_dataset_cache else dataset_cache_path(args)
+    if cache_path is not None and cache_path.exists():
+        print(f"Loading encoded datasets from {cache_path}...", flush=True)
+        prepared = load_dataset_cache(cache_path, args.max_char_len)
+    else:
+        prepared = build_datasets(args)
+        if cache_path is not None:
+            save_dataset_cache(cache_path, prepared)
+            print(f"Cached encoded datasets to {cache_path}", flush=True)
+    token_vocab, char_vocab, label_vocab, label_token_counts, train_dataset, validation_dataset = prepared
     print(
-        f"Training samples: {len(train_records):,} | Validation samples: {len(validation_records):,}",
+        f"Training samples: {len(train_dataset):,} | Validation samples: {len(validation_dataset):,}",
         flush=True,
     )
 
-    print("Building vocabularies...", flush=True)
-    token_vocab, char_vocab, label_vocab = build_vocab(train_records, args.min_token_freq)
     id_to_label = {index: label for label, index in label_vocab.items()}
     print(
         f"Token vocab: {len(token_vocab):,} | Char vocab: {len(char_vocab):,} | Labels: {len(label_vocab):,}",
@@ -678,9 +904,6 @@ def main() -> None:
     )
 
     # Inverse-frequency class weights (capped at 50x to prevent extreme values)
-    label_token_counts: Counter[str] = Counter()
-    for rec in train_records:
-        label_token_counts.update(rec["tags"])
     total_label_tokens = sum(label_token_counts.values())
     num_classes = len(label_vocab)
     class_weights = torch.ones(num_classes)
@@ -693,17 +916,9 @@ def main() -> None:
         flush=True,
     )
 
-    print("Encoding training dataset...", flush=True)
-    train_dataset = HybridDataset(
-        train_records, token_vocab, char_vocab, label_vocab, args.max_char_len
-    )
-    print("Encoding validation dataset...", flush=True)
-    validation_dataset = HybridDataset(
-        validation_records, token_vocab, char_vocab, label_vocab, args.max_char_len
-    )
-
     device = torch.device(args.device)
     configure_torch_runtime(device)
+    class_weights = class_weights.to(device)
 
     loader_kwargs = {
         "num_workers": args.num_workers,
@@ -713,13 +928,25 @@ def main() -> None:
         loader_kwargs["persistent_workers"] = True
         loader_kwargs["prefetch_factor"] = 4
 
-    train_loader = DataLoader(
-        train_dataset,
-        batch_size=args.batch_size,
-        shuffle=True,
-        collate_fn=collate_batch,
-        **loader_kwargs,
-    )
+    if args.no_length_grouping:
+        train_loader = DataLoader(
+            train_dataset,
+            batch_size=args.batch_size,
+            shuffle=True,
+            collate_fn=collate_batch,
+            **loader_kwargs,
+        )
+    else:
+        train_loader = DataLoader(
+            train_dataset,
+            batch_sampler=LengthGroupedBatchSampler(
+                [len(sample.token_ids) for sample in train_dataset.samples],
+                args.batch_size,
+                args.seed,
+            ),
+            collate_fn=collate_batch,
+            **loader_kwargs,
+        )
     validation_loader = DataLoader(
         validation_dataset,
         batch_size=args.batch_size,
@@ -735,7 +962,12 @@ def main() -> None:
         num_tags=len(label_vocab),
     ).to(device)
     model.crf.apply_bio_constraints(label_vocab)
-    optimizer = AdamW(model.parameters(), lr=args.learning_rate)
+    optimizer = AdamW(model.parameters(), lr=args.learning_rate, fused=device.type == "cuda")
+    amp_dtype = resolve_amp_dtype(device, args.precision)
+    # bf16 keeps fp32's exponent range; only fp16 needs loss scaling.
+    scaler = torch.amp.GradScaler(device.type) if amp_dtype == torch.float16 else None
+    if amp_dtype is not None:
+        print(f"Mixed precision: {amp_dtype}", flush=True)
     print("Starting training...", flush=True)
 
     best_metric = -1.0
@@ -746,8 +978,12 @@ def main() -> None:
             model, train_loader, optimizer, device,
             aux_ce_weight=args.aux_ce_weight,
             class_weights=class_weights,
+            amp_dtype=amp_dtype,
+            scaler=scaler,
+        )
+        validation_loss, metrics = evaluate(
+            model, validation_loader, device, id_to_label, amp_dtype=amp_dtype
         )
-        validation_loss, metrics = evaluate(model, validation_loader, device, id_to_label)
 
         print(
             f"epoch={epoch:02d} train_loss={train_loss:.4f} "
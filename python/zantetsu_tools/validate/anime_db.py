@@ -19,7 +19,7 @@ from pathlib import Path
 from typing import Optional
 
 from ..common.anime_db import AnimeDbClient
-from ..common.jsonl import write_jsonl
+from ..common.jsonl import loads_json, write_jsonl
 from ..common.paths import REPO_ROOT, TARGET_RELEASE_DIR
 
 
@@ -191,9 +191,9 @@ def run_benchmark() -> dict:
         return {}
 
     filenames = []
-    with open(benchmark_file) as f:
+    with open(benchmark_file, "rb") as f:
         for line in f:
-            data = json.loads(line)
+            data = loads_json(line)
             # Reconstruct filename from tokens
             filename = " ".join(data.get("tokens", []))
             filenames.append(filename)
@@ -255,46 +255,43 @@ def generate_validated_dataset(
 
     print(f"Loaded {len(raw_titles)} raw titles")
 
-    validated_samples = []
-    seen = set()
-
+    total = min(len(raw_titles), max_samples)
     print(f"Validating against AnimeDB API (max {max_samples} samples)...")
 
-    for i, title in enumerate(raw_titles[:max_samples]):
-        if i % 50 == 0:
-            print(f"  Progress: {i}/{min(len(raw_titles), max_samples)}")
+    def iter_validated_samples():
+        seen = set()
+        for i, title in enumerate(raw_titles[:max_samples]):
+            if i % 50 == 0:
+                print(f"  Progress: {i}/{total}")
 
-        if title in seen:
-            continue
-        seen.add(title)
+            if title in seen:
+                continue
+            seen.add(title)
 
-        # Search in AnimeDB
-        api_result = search_anime(title)
+            # Search in AnimeDB
+            api_result = search_anime(title)
 
-        if api_result and api_result.get("score", 0) > 0.3:
-            # Good match found - add as validated sample
-            validated_samples.append(
-                {
+            if api_result and api_result.get("score", 0) > 0.3:
+                # Good match found - add as validated sample
+                yield {
                     "title": title,
                     "anilist_id": api_result.get("id"),
                     "api_title": api_result.get("title"),
                     "api_score": api_result.get("score"),
                     "validation": "api_match",
                 }
-            )
-
-        # Rate limiting
-        time.sleep(0.3)
 
-    # Save validated dataset
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+            # Rate limiting
+            time.sleep(0.3)
 
-    write_jsonl(output_path, validated_samples)
+    # Samples are written as they are validated, so an interrupted run keeps
+    # everything fetched so far.
+    count = write_jsonl(output_path, iter_validated_samples())
 
-    print(f"\nGenerated {len(validated_samples)} validated samples")
+    print(f"\nGenerated {count} validated samples")
     print(f"Saved to {output_path}")
 
-    return len(validated_samples)
+    return count
 
 
 def main():